@@ -1,12 +1,11 @@
 from collections.abc import Iterable
-import copy
 import json
 import logging
 from types import TracebackType
 from typing import Any, Callable, TextIO
 from uuid import uuid4
 
-from .utils import no_op, create_local_file
+from .utils import no_op, create_local_file, get_logger
 
 _DELIMITER = "_"
 _ID_PREFIX = "R"
@@ -14,8 +13,14 @@ _ID = f"{_DELIMITER}rid{_DELIMITER}"
 _VAL = f"{_DELIMITER}val{_DELIMITER}"
 _INDEX = f"{_DELIMITER}index{_DELIMITER}"
 
+# Frame kinds for the explicit traversal stack used by `Relationalize._relationalize`.
+_DICT_FRAME = "dict"
+_LIST_FRAME = "list"
+_WRITE_FRAME = "write"
+
 DEFAULT_LOCAL_FILE_CALLABLE = create_local_file()
 DEFAULT_LOGLEVEL = logging.WARNING
+DEFAULT_FLUSH_THRESHOLD = 1024 * 1024   # characters buffered per output before it is written
 
 class Relationalize:
     """
@@ -23,12 +28,26 @@ class Relationalize:
 
     ignore_arrays = False by default, causing array fields to be separated into individual tables. Set ignore_arrays = True to leave arrays unmodified.
     ignore_objects = False by default, causing nested object fields to be flattened. Set ignore_objects = True to leave nested objects unmodified.
+    flush_threshold sets how many characters are buffered per output before they are written in a single call. Buffers are also flushed at the end of every `relationalize` call and on close.
     ```
     with Relationalize('abc') as r:
         r.relationalize([{"a": 1}])
     ```
     """
 
+    __slots__ = (
+        "name",
+        "create_output",
+        "on_object_write",
+        "ignore_arrays",
+        "ignore_objects",
+        "flush_threshold",
+        "outputs",
+        "_buffers",
+        "_buffer_sizes",
+        "logger",
+    )
+
     def __init__(
         self,
         name: str,
@@ -36,24 +55,20 @@ class Relationalize:
         on_object_write: Callable[[str, dict[str, Any]], None] = no_op,
         ignore_arrays: bool = False,
         ignore_objects: bool = False,
-        log_level=DEFAULT_LOGLEVEL
+        log_level=DEFAULT_LOGLEVEL,
+        flush_threshold: int = DEFAULT_FLUSH_THRESHOLD
     ):
         self.name = name
         self.create_output = create_output
         self.on_object_write = on_object_write
         self.ignore_arrays = ignore_arrays
         self.ignore_objects = ignore_objects
+        self.flush_threshold = flush_threshold
         self.outputs: dict[str, TextIO] = {}
+        self._buffers: dict[str, list[str]] = {}
+        self._buffer_sizes: dict[str, int] = {}
 
-        # Configure logger
-        logger = logging.getLogger(self.__class__.__name__)
-        logger.setLevel(log_level)
-        if not logger.handlers:
-            handler = logging.StreamHandler()
-            formatter = logging.Formatter('%(asctime)s - [%(name)s, %(levelname)s] %(message)s')
-            handler.setFormatter(formatter)
-            logger.addHandler(handler)
-        self.logger = logger
+        self.logger = get_logger(self.__class__.__name__, log_level)
 
     def __enter__(self):
         return self
@@ -72,17 +87,41 @@ class Relationalize:
 
         Pass in an Iterable and it will relationalize it, outputing to wherever was designated when instantiating the class.
         """
+        # Bound to locals to skip the attribute lookups on every item
+        name = self.name
+        relationalize_item = self._relationalize
+        write_to_output = self._write_to_output
         for item in object_list:
-            self._write_to_output(self.name, self._relationalize(item))
+            write_to_output(name, relationalize_item(item))
+        self.flush_io()
 
     def _write_row(self, key: str, row: dict[str, Any]):
         """
         Writes a row to the given output.
+
+        Rows are buffered and written to the output once `flush_threshold` characters have accumulated.
         """
-        _ = self.outputs[key].write(json.dumps(row))
-        _ = self.outputs[key].write("\n")
+        line = json.dumps(row)
+        buffer = self._buffers[key]
+        buffer.append(line)
+        buffer.append("\n")
+        buffer_size = self._buffer_sizes[key] + len(line) + 1
+        if buffer_size >= self.flush_threshold:
+            self._flush_buffer(key)
+        else:
+            self._buffer_sizes[key] = buffer_size
         self.on_object_write(key, row)
 
+    def _flush_buffer(self, key: str):
+        """
+        Writes any buffered rows to the given output in a single call.
+        """
+        buffer = self._buffers[key]
+        if buffer:
+            _ = self.outputs[key].write("".join(buffer))
+            buffer.clear()
+        self._buffer_sizes[key] = 0
+
     def _write_to_output(
         self, key: str, content: dict[str, Any] | list[dict[str, Any]], is_sub: bool = False
     ):
@@ -94,65 +133,120 @@ class Relationalize:
         identifier = f"{self.name}{_DELIMITER}{key}" if is_sub else key
         if identifier not in self.outputs:
             self.outputs[identifier] = self.create_output(identifier)
+            self._buffers[identifier] = []
+            self._buffer_sizes[identifier] = 0
         if isinstance(content, list):
             for row in content:
                 self._write_row(identifier, row)
             return
         self._write_row(identifier, content)
 
-    def _list_helper(self, id: str, index: int, row: dict[str, object] | Any, path: str):
+    def _list_helper(self, id: str, index: int, row: dict[str, object] | Any) -> dict[str, object]:
         """
         Helper for relationalizing lists.
 
         Handles the difference between an array of literals and an array of structs.
+        Returns the row to relationalize into the sub-table for the given element.
         """
-        new_row: dict[str, object] = copy.deepcopy(row)
         if isinstance(row, dict):
+            new_row: dict[str, object] = dict(row)
             new_row[_ID] = id
             new_row[_INDEX] = index
-            return self._relationalize(new_row, path=path, from_array=True, table_path=path)
+            return new_row
 
-        return self._relationalize({_VAL: new_row, _ID: id, _INDEX: index}, path=path, from_array=True, table_path=path)
+        return {_VAL: row, _ID: id, _INDEX: index}
 
     def _relationalize(self, d: list[Any] | dict[str, Any] | str, path: str = "", from_array: bool = False, table_path: str = ""):
         """
-        Recursive back bone of the relationalize structure.
+        Back bone of the relationalize structure.
 
         Traverses any arbitrary JSON structure flattening and relationalizing.
+        The traversal is iterative, using an explicit stack of frames instead of recursion, so deeply nested
+        structures are not bound by the interpreter recursion limit.
 
         from_array = True indicates that we are relationalizing a field that is sourced from an array.
         This means that subsequent column names will not be not prefixed with path_prefix, but any newly created subtables will retain their path history.
         """
-        path_prefix = f"{path}{_DELIMITER}"
-        if path == "" or from_array:
-            path_prefix = ""
+        output: dict[str, object] = {}
+        stack: list[tuple[Any, ...]] = []
+        self._flatten_value(d, output, path, from_array, table_path, stack)
+        while stack:
+            frame = stack[-1]
+            kind = frame[0]
+            if kind is _WRITE_FRAME:
+                # All of the row's children have been written, the row itself can now be written.
+                stack.pop()
+                self._write_to_output(key=frame[1], content=frame[2], is_sub=True)
+            elif kind is _DICT_FRAME:
+                _, items, frame_output, path_prefix, table_prefix = frame
+                item = next(items, None)
+                if item is None:
+                    stack.pop()
+                    continue
+                key, value = item
+                child_table_path = ""
+                if table_prefix is not None:
+                    child_table_path = f"{table_prefix}{key}"
+                self._flatten_value(value, frame_output, f"{path_prefix}{key}", False, child_table_path, stack)
+            else:
+                _, elements, id, key_path, list_path = frame
+                element = next(elements, None)
+                if element is None:
+                    stack.pop()
+                    continue
+                index, row = element
+                row_output: dict[str, object] = {}
+                stack.append((_WRITE_FRAME, key_path, row_output))
+                self._flatten_value(
+                    self._list_helper(id, index, row), row_output, list_path, True, list_path, stack
+                )
+        return output
+
+    def _flatten_value(
+        self,
+        d: Any,
+        output: dict[str, object],
+        path: str,
+        from_array: bool,
+        table_path: str,
+        stack: list[tuple[Any, ...]],
+    ):
+        """
+        Flattens a single value into `output`.
+
+        Literals are written directly. Dicts and non-empty lists push a frame onto `stack` to be traversed by `_relationalize`.
+        """
         if isinstance(d, list):
             if len(d) == 0:
-                return {path: None}
-            
+                output[path] = None
+                return
+
             if not self.ignore_arrays:
                 id = Relationalize._generate_rid()
-                for index, row in enumerate(d):
-                    key_path = path
-                    if table_path:
-                        key_path = table_path
-                    self._write_to_output(
-                        key=f"{key_path}", content=self._list_helper(id, index, row, path=path), is_sub=True
-                    )
-                return {path: id}
+                output[path] = id
+                stack.append((_LIST_FRAME, iter(enumerate(d)), id, table_path or path, path))
+                return
         elif isinstance(d, dict):
             if path == "" or not self.ignore_objects:
-                temp_d: dict[str, object] = {}
-                for key in d:
-                    temp_table_path = ""
-                    if from_array:
-                        temp_table_path = f"{table_path}{_DELIMITER}{key}"
-                    temp_d.update(self._relationalize(d[key], path=f"{path_prefix}{key}", table_path=temp_table_path))
-                return temp_d
+                # Prefixes are computed once per object rather than once per key.
+                path_prefix = f"{path}{_DELIMITER}"
+                if path == "" or from_array:
+                    path_prefix = ""
+                table_prefix = f"{table_path}{_DELIMITER}" if from_array else None
+                stack.append((_DICT_FRAME, iter(d.items()), output, path_prefix, table_prefix))
+                return
+
+        output[path] = d
 
-        return {path: d}
+    def flush_io(self) -> None:
+        """
+        Writes all buffered rows to their outputs.
+        """
+        for key in self.outputs:
+            self._flush_buffer(key)
 
     def close_io(self) -> None:
+        self.flush_io()
         for file_object in self.outputs.values():
             file_object.close()
 
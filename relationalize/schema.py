@@ -1,11 +1,16 @@
+from bisect import insort
 import json
 import logging
-from typing import Any, Final, Generic, TypedDict, TypeVar, cast
+import re
+from collections.abc import Iterable
+from functools import lru_cache
+from typing import Any, Callable, Final, Generic, TypedDict, TypeVar, cast
 
-from relationalize.types import BaseSupportedColumnType, ChoiceColumnType, ColumnType, UnsupportedColumnType, is_choice_column_type, is_unsupported_column_type, parse_type_int, parse_type_string
+from relationalize.types import BaseSupportedColumnType, ChoiceColumnType, ColumnType, UnsupportedColumnType, is_choice_column_type, is_unsupported_column_type, parse_type_float, parse_type_int, parse_type_string
 
 from .sql_dialects import PostgresDialect, SQLDialect
 from .nosql_dialects import MongoDialect, NoSQLDialect
+from .utils import get_logger
 
 DialectColumnType = TypeVar('DialectColumnType')
 
@@ -14,6 +19,69 @@ DEFAULT_SOURCE_DIALECT = MongoDialect()     # source dialect
 DEFAULT_SQL_DIALECT = PostgresDialect()     # target dialect
 DEFAULT_LOGLEVEL = logging.WARNING
 
+# Exact type -> parser used by `Schema._parse_type`. Keyed on `type(value)`, so `bool` never resolves to the `int` parser.
+_PARSE_TYPE_DISPATCH: Final[dict[type, Callable[[Any], ColumnType]]] = {
+    str: parse_type_string,
+    list: lambda _: "str_arr",
+    dict: lambda _: "str_obj",
+    bool: lambda _: "bool",
+    int: parse_type_int,
+    float: parse_type_float,
+    type(None): lambda _: "none",
+}
+
+@lru_cache(maxsize=32)
+def _special_char_pattern(allowed_chars: frozenset[str]) -> re.Pattern[str]:
+    """
+    Compiles a pattern matching any character that is neither alphanumeric nor in `allowed_chars`.
+
+    `\\w` matches exactly the `str.isalnum` characters plus the underscore, so the underscore is excluded separately when it is not allowed.
+    """
+    allowed = "".join(re.escape(c) for c in sorted(allowed_chars))
+    if "_" in allowed_chars:
+        return re.compile(f"[^\\w{allowed}]")
+    return re.compile(f"[^\\w{allowed}]|_")
+
+@lru_cache(maxsize=1024)
+def _choice_set(value_type: str) -> frozenset[str]:
+    """
+    The member types of a choice column type, for membership tests.
+
+    Testing membership against the type string itself would match substrings, e.g. `int` within `c-bigint-str`.
+    """
+    return frozenset(_choice_parts(value_type))
+
+@lru_cache(maxsize=1024)
+def _choice_parts(value_type: str) -> tuple[BaseSupportedColumnType, ...]:
+    """
+    Splits a choice column type (e.g. `c-int-str`) into its member types.
+
+    Memoized, as only a handful of distinct choice types exist in practice.
+    """
+    return cast(tuple[BaseSupportedColumnType, ...], tuple(value_type[2:].split(Schema._CHOICE_DELIMITER)))
+
+@lru_cache(maxsize=1024)
+def _non_null_types(value_type: str) -> frozenset[str]:
+    """
+    The types `Schema.merge` unifies a column type into: the member types of a choice type, or the type itself, without `none`.
+    """
+    types = _choice_parts(value_type) if Schema._CHOICE_SEQUENCE in value_type else (value_type,)
+    return frozenset(types) - {"none"}
+
+@lru_cache(maxsize=1024)
+def _merge_column_types(type1: ColumnType, type2: ColumnType) -> ColumnType:
+    """
+    The column type `Schema.merge` resolves two differing column types to.
+
+    Memoized, so that it acts as a transition table over the handful of type pairs that occur in practice.
+    """
+    choices = _non_null_types(type1) | _non_null_types(type2)
+    if len(choices) == 0:
+        return "none"
+    if len(choices) == 1:
+        return cast(BaseSupportedColumnType, next(iter(choices)))
+    return ChoiceColumnType(f"{Schema._CHOICE_SEQUENCE}{Schema._CHOICE_DELIMITER.join(sorted(choices))}")
+
 class ColumnDict(TypedDict):
     """
     A class to explicitly define valid Schema.schema dict values
@@ -30,6 +98,8 @@ class Schema(Generic[DialectColumnType]):
     _CHOICE_DELIMITER: str = "-"
     _UNSUPPORTED_SEQUENCE: str = "unsupported:"
 
+    __slots__ = ("_types", "_primary", "_choice", "source_dialect", "_converter", "logger")
+
     def __init__(
         self,
         schema: dict[str, ColumnDict] | None = None,
@@ -38,100 +108,142 @@ class Schema(Generic[DialectColumnType]):
     ):
         if schema is None:
             schema = dict()
+        # Column types and primary key columns are stored separately. See the `schema` property.
+        self._types: dict[str, ColumnType] = {}
+        self._primary: set[str] = set()
+        self._choice: set[str] = set()     # keys whose type is a choice column type
+        self._converter: Callable[[dict[str, Any]], dict[str, Any]] | None = None
         self.schema = schema
         self.source_dialect = source_dialect
 
-        # Configure logger
-        logger = logging.getLogger(self.__class__.__name__)
-        logger.setLevel(log_level)
-        if not logger.handlers:
-            handler = logging.StreamHandler()
-            formatter = logging.Formatter('%(asctime)s - [%(name)s, %(levelname)s] %(message)s')
-            handler.setFormatter(formatter)
-            logger.addHandler(handler)
-        self.logger = logger
+        self.logger = get_logger(self.__class__.__name__, log_level)
+
+    @property
+    def schema(self) -> dict[str, ColumnDict]:
+        """
+        The schema as a dict of column name to `ColumnDict`.
+
+        A new dict is built on every access. Modifying it does not modify this schema; assign a new dict instead.
+        """
+        primary = self._primary
+        return {key: {"type": value_type, "is_primary": key in primary} for key, value_type in self._types.items()}
+
+    @schema.setter
+    def schema(self, schema: dict[str, ColumnDict]):
+        self._types = {key: col["type"] for key, col in schema.items()}
+        self._primary = {key for key, col in schema.items() if col.get("is_primary", False)}
+        self._choice = {key for key, value_type in self._types.items() if is_choice_column_type(value_type)}
+        self._converter = None
+
+    def __getstate__(self):
+        # The compiled converter is a closure, so copies and pickles are rebuilt through the `schema` setter instead
+        return (self.schema, self.source_dialect, self.logger)
+
+    def __setstate__(self, state):
+        schema, self.source_dialect, self.logger = state
+        self.schema = schema
 
     def convert_object(self, record: dict[str, Any]) -> dict[str, Any]:
         """
         Convert a given object according to the schema.
         Splits choice-columns into N separate columns and renames keys accordingly.
 
+        Uses the function returned by `compile`, which is rebuilt whenever the schema is modified through this class.
+        """
+        if self._converter is None:
+            self._converter = self.compile()
+        return self._converter(record)
+
+    def compile(self) -> Callable[[dict[str, Any]], dict[str, Any]]:
+        """
+        Compile the current schema into a function equivalent to `convert_object`.
+
+        The schema is partitioned into passthrough and choice columns, and choice sub-column names are built, once,
+        so the returned function only does per-record work.
         Chooses between schema-iteration and object-iteration depending on which one will be more efficient.
+
+        The returned function reflects the schema at the time it was compiled.
         """
-        if len(self.schema) > len(record):
-            return self._convert_object_object_iteration(record)
-        return self._convert_object_schema_iteration(record)
-
-    def _convert_object_schema_iteration(
-        self, record: dict[str, object]
-    ) -> dict[str, object]:
-        output_object: dict[str, object] = {}
-        for key, col in self.schema.items():
-            if key not in record:
-                continue
-            value_type = col["type"]
-            object_value = record[key]
-            if object_value is None:
-                output_object[key] = object_value
-                continue
-            if is_choice_column_type(value_type):
-                # determine which type this object is and enter into correct sub-column
-                object_value_type = self._parse_type(object_value)
-                if object_value_type not in value_type:
-                    raise Exception(
-                        (
-                            "Unknown type found within object. But not within the schema.\n"
-                            f"schema types: {value_type}\n"
-                            f"object type: {object_value_type}"
-                        )
+        schema_keys = list(self._types)
+        schema_key_set = frozenset(schema_keys)
+        schema_length = len(schema_keys)
+        choice_types: dict[str, ColumnType] = {key: self._types[key] for key in self._choice}
+        # choice column -> {member type -> sub-column name}, so sub-column names are only built once
+        choice_columns: dict[str, dict[str, str]] = {
+            key: {choice_type: f"{key}_{choice_type}" for choice_type in _choice_parts(value_type)}
+            for key, value_type in choice_types.items()
+        }
+        parse_type = Schema._parse_type
+
+        def choice_column(key: str, object_value: object) -> str:
+            # determine which type this object is and enter into correct sub-column
+            object_value_type = parse_type(object_value)
+            column = choice_columns[key].get(object_value_type)
+            if column is None:
+                value_type = choice_types[key]
+                raise Exception(
+                    (
+                        "Unknown type found within object. But not within the schema.\n"
+                        f"schema types: {value_type}\n"
+                        f"object type: {object_value_type}"
                     )
-                output_object[f"{key}_{object_value_type}"] = object_value
-                continue
-            # Non-Choice column. Do Nothing.
-            output_object[key] = object_value
-        return output_object
-
-    def _convert_object_object_iteration(
-        self, record: dict[str, object]
-    ) -> dict[str, object]:
-        output_object: dict[str, object] = {}
-        for key, object_value in record.items():
-            if object_value is None:
+                )
+            return column
+
+        def convert_object_object_iteration(record: dict[str, Any]) -> dict[str, Any]:
+            output_object: dict[str, Any] = {}
+            for key, object_value in record.items():
+                if object_value is None:
+                    output_object[key] = object_value
+                    continue
+                if key in choice_types:
+                    output_object[choice_column(key, object_value)] = object_value
+                    continue
+                if key in schema_key_set:
+                    # noop. no choice found.
+                    output_object[key] = object_value
+            return output_object
+
+        def convert_object_schema_iteration(record: dict[str, Any]) -> dict[str, Any]:
+            output_object: dict[str, Any] = {}
+            for key in schema_keys:
+                if key not in record:
+                    continue
+                object_value = record[key]
+                if object_value is not None and key in choice_types:
+                    output_object[choice_column(key, object_value)] = object_value
+                    continue
+                # Non-Choice column. Do Nothing.
                 output_object[key] = object_value
-                continue
-            if key not in self.schema:
-                continue
-            value_type = self.schema[key]["type"]
-            if is_choice_column_type(value_type):
-                # determine which type this object is and enter into correct sub-column
-                object_value_type = self._parse_type(object_value)
-                if object_value_type not in value_type:
-                    raise Exception(
-                        (
-                            "Unknown type found within object. But not within the schema.\n"
-                            f"schema types: {value_type}\n"
-                            f"object type: {object_value_type}"
-                        )
-                    )
-                output_object[f"{key}_{object_value_type}"] = object_value
-                continue
-            # noop. no choice found.
-            output_object[key] = object_value
-        return output_object
+            return output_object
+
+        def convert_object(record: dict[str, Any]) -> dict[str, Any]:
+            if schema_length > len(record):
+                return convert_object_object_iteration(record)
+            return convert_object_schema_iteration(record)
+
+        def convert_object_no_choice(record: dict[str, Any]) -> dict[str, Any]:
+            # Without choice columns, conversion only filters keys, which a comprehension does in one pass.
+            if schema_length > len(record):
+                return {key: value for key, value in record.items() if value is None or key in schema_key_set}
+            return {key: record[key] for key in schema_keys if key in record}
+
+        if not choice_types:
+            return convert_object_no_choice
+        return convert_object
 
     def generate_output_columns(self) -> list[str]:
         """
         Generates the columns that will be in the output of `convert_object`
         """
         columns: list[str] = []
-        for key, col in self.schema.items():
-            value_type = col["type"]
-            if Schema._CHOICE_SEQUENCE not in value_type:
+        for key, value_type in self._types.items():
+            if key not in self._choice:
                 # Column is not a choice column
                 columns.append(key)
                 continue
             # Generate a column per choice-type
-            for choice_type in value_type[2:].split(Schema._CHOICE_DELIMITER):
+            for choice_type in _choice_parts(value_type):
                 if choice_type == "none":
                     continue
                 columns.append(f"{key}_{choice_type}")
@@ -150,38 +262,43 @@ class Schema(Generic[DialectColumnType]):
         columns_none: list[str] = [] # The columns with the none data type. These are columns that might not need to be created.
         columns_multitype: list[str] = [] # Multi data type columns
 
-        columns: list[str] = []
-        for key, col in self.schema.items():
-            value_type = col["type"]
-            is_primary = col["is_primary"]
+        # (column name, column DDL) pairs, sorted by column name so the DDL matches `generate_output_columns`
+        columns: list[tuple[str, str]] = []
+        generate_ddl_column = sql_dialect.generate_ddl_column
+        type_column_mapping = sql_dialect.type_column_mapping
+        for key, value_type in self._types.items():
+            is_primary = key in self._primary
             if "bigint" in value_type:
                 self.logger.debug(f"The '{key}' column in the '{table}' table has values of type BIGINT.\n")
 
 
             if is_primary:
                 columns_pk.append(key)
-            if Schema._CHOICE_SEQUENCE not in value_type:
+            if key not in self._choice:
                 # Column is not a choice column
-                columns.append(
-                    sql_dialect.generate_ddl_column(
-                        key, sql_dialect.type_column_mapping[value_type], is_primary
+                columns.append((
+                    key,
+                    generate_ddl_column(
+                        key, type_column_mapping[value_type], is_primary
                     )
-                )
+                ))
                 if value_type == "none":
                     columns_none.append(key)
                 continue
             # Generate a column per choice-type
             columns_multitype.append(f"{key} ({value_type})")
-            for choice_type in cast(list[BaseSupportedColumnType], value_type[2:].split(Schema._CHOICE_DELIMITER)):
+            for choice_type in _choice_parts(value_type):
                 if choice_type == "none":
                     continue
-                columns.append(
-                    sql_dialect.generate_ddl_column(
-                        f"{key}_{choice_type}",
-                        sql_dialect.type_column_mapping[choice_type],
+                choice_key = f"{key}_{choice_type}"
+                columns.append((
+                    choice_key,
+                    generate_ddl_column(
+                        choice_key,
+                        type_column_mapping[choice_type],
                         is_primary
                     )
-                )
+                ))
         columns.sort()
 
         # Ensure a reasonable # of primary key columns
@@ -209,7 +326,7 @@ class Schema(Generic[DialectColumnType]):
                 f"These columns are: {columns_multitype}"
             )
 
-        return sql_dialect.generate_ddl(schema, table, columns, schema_qualified)
+        return sql_dialect.generate_ddl(schema, table, [column for _, column in columns], schema_qualified)
 
     def drop_null_columns(self) -> int:
         """
@@ -218,14 +335,11 @@ class Schema(Generic[DialectColumnType]):
         Returns the # of columns that were dropped.
         """
         columns_to_drop: list[str] = []
-        for key, col in self.schema.items():
-            value_type = col["type"]
+        for key, value_type in self._types.items():
             if value_type == "none":
                 columns_to_drop.append(key)
 
-        for column in columns_to_drop:
-            del self.schema[column]
-        return len(columns_to_drop)
+        return self._drop_columns(columns_to_drop)
 
     def drop_special_char_columns(self, allowed_chars: set[str] = ALLOWED_COLUMN_CHARS) -> int:
         """
@@ -235,14 +349,10 @@ class Schema(Generic[DialectColumnType]):
 
         Returns the # of columns that were dropped.
         """
-        columns_to_drop: list[str] = []
-        for key in self.schema.keys():
-            if any(not (c.isalnum() or c in allowed_chars) for c in key):
-                columns_to_drop.append(key)
+        search = _special_char_pattern(frozenset(allowed_chars)).search
+        columns_to_drop = [key for key in self._types if search(key)]
 
-        for column in columns_to_drop:
-            del self.schema[column]
-        return len(columns_to_drop)
+        return self._drop_columns(columns_to_drop)
 
     def drop_duplicate_columns(self) -> int:
         """
@@ -252,14 +362,22 @@ class Schema(Generic[DialectColumnType]):
         """
         lowercased_keys: set[str] = set()
         columns_to_drop: list[str] = []
-        for key in self.schema.keys():
-            if key.casefold() not in lowercased_keys:
-                lowercased_keys.add(key.casefold())
-            else:
+        for key in self._types:
+            lowercased_key = key.casefold()
+            if lowercased_key in lowercased_keys:
                 columns_to_drop.append(key)
+            else:
+                lowercased_keys.add(lowercased_key)
 
+        return self._drop_columns(columns_to_drop)
+
+    def _drop_columns(self, columns_to_drop: list[str]) -> int:
         for column in columns_to_drop:
-            del self.schema[column]
+            del self._types[column]
+            self._primary.discard(column)
+            self._choice.discard(column)
+        if columns_to_drop:
+            self._converter = None
         return len(columns_to_drop)
 
     def read_object(self, record: dict[str, object]):
@@ -269,6 +387,21 @@ class Schema(Generic[DialectColumnType]):
         for key, value in record.items():
             self._read_write_object_key(key, value)
 
+    def read_objects(self, records: Iterable[dict[str, object]]):
+        """
+        Read multiple objects and merge them into the current schema.
+
+        Equivalent to calling `read_object` on each record, but values whose type already matches the schema skip the merge logic entirely.
+        """
+        types = self._types
+        parse_type = Schema._parse_type
+        read_write_object_key = self._read_write_object_key
+        for record in records:
+            for key, value in record.items():
+                value_type = parse_type(value)
+                if types.get(key) != value_type:
+                    read_write_object_key(key, value, value_type)
+
     def serialize(self) -> str:
         """
         Serialize this schema to a string.
@@ -282,61 +415,70 @@ class Schema(Generic[DialectColumnType]):
         """
         return Schema(schema=json.loads(content))
 
-    def _read_write_object_key(self, key: str, value: object):
-        value_type = Schema._parse_type(value)
+    def _set_column_type(self, key: str, value_type: ColumnType):
+        self._types[key] = value_type
+        if is_choice_column_type(value_type):
+            self._choice.add(key)
+        else:
+            self._choice.discard(key)
+        self._converter = None
+
+    def _read_write_object_key(self, key: str, value: object, value_type: ColumnType | None = None):
+        if value_type is None:
+            value_type = Schema._parse_type(value)
 
         if is_unsupported_column_type(value_type):
             # Ignore any values whose type cannot be parsed (unsupported types)
             self.logger.warning(f"The key {key} has the value {value} of type {value_type}. Since this data type is not supported, this key-value pair will be ignored.")
             return
-        if key not in self.schema:
+        current_type = self._types.get(key)
+        if current_type is None:
             # Key has not been encountered yet. Set type in schema to type of value, and add primary key param as necessary
-            is_primary = self.source_dialect.is_primary_key(key)
-            self.schema[key] = { "type": value_type, "is_primary": is_primary }
+            if self.source_dialect.is_primary_key(key):
+                self._primary.add(key)
+            self._set_column_type(key, value_type)
             return
-        if self.schema[key]["type"] == value_type:
+        if current_type == value_type:
             # Entry in schema for this key has same type as this record. Do Nothing.
             return
-        if self.schema[key]["type"] == "none":
+        if current_type == "none":
             # Entry in schema for this key is `none`. Set type in schema to type of value.
-            self.schema[key]["type"] = value_type
+            self._set_column_type(key, value_type)
             return
         # Entry in schema exists for this key and the type for value is different.
         if value_type == "none":
             # Value type is `none` but existing entry in schema exists. Do Nothing.
             return
-        if self.schema[key]["type"][:2] == Schema._CHOICE_SEQUENCE:
+        if key in self._choice:
             # Entry in schema is a choice column.
-            if value_type in self.schema[key]["type"]:
+            if value_type in _choice_set(current_type):
                 # Type for Value is already in the schema choice pattern. Do Nothing.
                 return
 
-            # Add this type into the choice pattern.
-            self.schema[key]["type"] = ChoiceColumnType(f"{self.schema[key]['type']}{Schema._CHOICE_DELIMITER}{value_type}")
-
-            choices = self.schema[key]["type"].split(Schema._CHOICE_DELIMITER)[1:]
+            # Add this type into the choice pattern. Choice types are kept sorted so things are predictable.
+            choices: list[str] = list(_choice_parts(current_type))
+            insort(choices, value_type)
             # Remove `none` type from choices
             if "none" in choices:
                 choices.remove("none")
             # Check if choices is only of length 1 and remove choice pattern.
             if len(choices) == 1:
-                self.schema[key]["type"] = cast(BaseSupportedColumnType, choices[0])
+                self._set_column_type(key, cast(BaseSupportedColumnType, choices[0]))
                 return
-            # Reorder the types so things are predictable.
-            self.schema[key]["type"] = ChoiceColumnType(f"{Schema._CHOICE_SEQUENCE}{Schema._CHOICE_DELIMITER.join(sorted(choices))}")
+            self._set_column_type(key, ChoiceColumnType(f"{Schema._CHOICE_SEQUENCE}{Schema._CHOICE_DELIMITER.join(choices)}"))
             return
 
         # Handle multi-data type case by generalization
-        if self.schema[key]["type"] == "int" and value_type == "float":
+        if current_type == "int" and value_type == "float":
             # Entries in schema for this key were 'int', but with new float type detected, they should be replaced by the more general 'float' type
-            self.schema[key]["type"] = value_type
+            self._set_column_type(key, value_type)
             return
-        if self.schema[key]["type"] == "float" and value_type == "int":
+        if current_type == "float" and value_type == "int":
             # Entry in schema for this key is a 'float', which encapsulates 'int'. Do Nothing.
             return
     
         # Create new 2-type choice pattern
-        self.schema[key]["type"] = ChoiceColumnType(f"{Schema._CHOICE_SEQUENCE}{Schema._CHOICE_DELIMITER.join(sorted([self.schema[key]['type'], value_type]))}")
+        self._set_column_type(key, ChoiceColumnType(f"{Schema._CHOICE_SEQUENCE}{Schema._CHOICE_DELIMITER.join(sorted([current_type, value_type]))}"))
 
     @staticmethod
     def merge(*args: dict[str, ColumnDict]):
@@ -346,39 +488,16 @@ class Schema(Generic[DialectColumnType]):
         merged_schema: dict[str, ColumnDict] = {}
         for schema in args:
             for key, col in schema.items():
-                if key not in merged_schema:
-                    merged_schema[key] = col
+                merged_col = merged_schema.get(key)
+                if merged_col is None:
+                    # Copied, so that merging never modifies the input schemas
+                    merged_schema[key] = col.copy()
                     continue
-                if col == merged_schema[key]:
+                if col == merged_col:
                     continue
 
                 # key is in the new schema already and has different type
-                choices: set[str] = set()
-                if Schema._CHOICE_SEQUENCE in merged_schema[key]["type"]:
-                    for t in merged_schema[key]["type"][2:].split(Schema._CHOICE_DELIMITER):
-                        if t == "none":
-                            continue
-                        choices.add(t)
-                else:
-                    choices.add(merged_schema[key]["type"])
-                if Schema._CHOICE_SEQUENCE in col["type"]:
-                    for t in col["type"][2:].split(Schema._CHOICE_DELIMITER):
-                        if t == "none":
-                            continue
-                        choices.add(t)
-                else:
-                    choices.add(col["type"])
-
-                if "none" in choices:
-                    choices.remove("none")
-                if len(choices) == 0:
-                    merged_schema[key]["type"] = "none"
-                    continue
-                if len(choices) == 1:
-                    merged_schema[key]["type"] = cast(BaseSupportedColumnType, choices.pop())
-                    continue
-
-                merged_schema[key]["type"] = ChoiceColumnType(f"{Schema._CHOICE_SEQUENCE}{Schema._CHOICE_DELIMITER.join(sorted(choices))}")
+                merged_col["type"] = _merge_column_types(merged_col["type"], col["type"])
         return Schema(schema=merged_schema)
 
     @staticmethod
@@ -386,6 +505,10 @@ class Schema(Generic[DialectColumnType]):
         """
         Get the type of a given value
         """
+        parser = _PARSE_TYPE_DISPATCH.get(type(value))
+        if parser is not None:
+            return parser(value)
+        # Fall back to isinstance checks for subclasses of the supported types
         if isinstance(value, str):
             return parse_type_string(value)
         if isinstance(value, list):
@@ -397,9 +520,7 @@ class Schema(Generic[DialectColumnType]):
         if isinstance(value, int):
             return parse_type_int(value)
         if isinstance(value, float):
-            if value.is_integer():
-                return parse_type_int(int(value))
-            return "float"
+            return parse_type_float(value)
         if value is None:
             return "none"
         return UnsupportedColumnType(f"{Schema._UNSUPPORTED_SEQUENCE}{type(value)}")
@@ -54,6 +54,9 @@ postgres_column_param: dict[SupportedColumnParam, str] = {
     "primary_key": "PRIMARY KEY",
 }
 
+# Appended to the column definition by `generate_ddl_column` when is_primary = True
+_POSTGRES_PRIMARY_KEY_SUFFIX = f' {postgres_column_param["primary_key"]}'
+
 class PostgresDialect(SQLDialect[PostgresColumnType]):
     """
     Inherits from `SQLDialect` and implements the postgres syntax.
@@ -83,11 +86,9 @@ CREATE TABLE IF NOT EXISTS "{table_name}" (
 
     @staticmethod
     def generate_ddl_column(column_name: str, column_type: PostgresColumnType, is_primary: bool = False):
-        cleaned_column_name = column_name.replace('"', '""')
-        column_str = f'"{cleaned_column_name}" {column_type}'
-        if is_primary:
-            column_str = f'"{cleaned_column_name}" {column_type} {postgres_column_param["primary_key"]}'
-        return DDLColumn(column_str)
+        cleaned_column_name = column_name.replace('"', '""') if '"' in column_name else column_name
+        suffix = _POSTGRES_PRIMARY_KEY_SUFFIX if is_primary else ''
+        return DDLColumn(f'"{cleaned_column_name}" {column_type}{suffix}')
 
 
 # Flink SQL #
@@ -102,10 +103,13 @@ FlinkColumnType = Literal[
     'TIMESTAMP_LTZ',
 ]
 
-flink_column_param: dict[(SupportedColumnParam, str), str] = {
+flink_column_param: dict[SupportedColumnParam, str] = {
     "primary_key": "PRIMARY KEY",
 }
 
+# Appended to the column definition by `generate_ddl_column` when is_primary = True
+_FLINK_PRIMARY_KEY_SUFFIX = f' {flink_column_param["primary_key"]} NOT ENFORCED'
+
 class FlinkDialect(SQLDialect[FlinkColumnType]):
     """
     Inherits from `SQLDialect` and implements the Flink SQL syntax.
@@ -140,8 +144,6 @@ CREATE TABLE IF NOT EXISTS `{table_name}` (
         '''
         is_primary = True adds a primary key constraint to the column. Default is False. Since Flink does not own the data, primary keys will always be in NOT ENFORCED mode. 
         '''
-        cleaned_column_name = column_name.replace('"', '""')
-        column_str = f'`{cleaned_column_name}` {column_type}'
-        if is_primary:
-            column_str = f'`{cleaned_column_name}` {column_type} {flink_column_param["primary_key"]} NOT ENFORCED'
-        return DDLColumn(column_str)
+        cleaned_column_name = column_name.replace('`', '``') if '`' in column_name else column_name
+        suffix = _FLINK_PRIMARY_KEY_SUFFIX if is_primary else ''
+        return DDLColumn(f'`{cleaned_column_name}` {column_type}{suffix}')
@@ -1,5 +1,6 @@
 import re
 from datetime import datetime
+from functools import lru_cache
 from typing import Literal, NewType, TypeGuard
 
 """
@@ -49,8 +50,15 @@ def parse_type_int(value: int):
         return 'bigint'
     return 'int'
 
+def parse_type_float(value: float):
+    if value.is_integer():
+        return parse_type_int(int(value))
+    return 'float'
+
 # Initial datetime regex that matches a string starting with "%Y-%m-%d %H:%M:%S" and anything after
 DATETIME_REGEX = r'^\d{4}-\d{2}-\d{2}[T ]\d{2}:\d{2}:\d{2}.*$'
+# Compiled prefix-only form of DATETIME_REGEX, used to limit the strptime fallback in `_is_valid_datetime`
+_DATETIME_RE = re.compile(r'\d{4}-\d{2}-\d{2}[T ]\d{2}:\d{2}:\d{2}')
 DATETIME_VALID_FORMATS = [
     "%Y-%m-%d %H:%M:%S.%f",     # With milliseconds                     (e.g. 2017-11-12 22:38:59.010000)
     "%Y-%m-%d %H:%M:%S.%f%z",   # With milliseconds, tz offset          (e.g. 2017-11-12 22:38:59.010000-0500, 2017-11-12 22:38:59.01-05:00)
@@ -59,14 +67,79 @@ DATETIME_VALID_FORMATS = [
     "%Y-%m-%dT%H:%M:%S",        # Without milliseconds, T sep           (e.g. 2017-11-12T22:38:59)
 ]
 
+# Full form of DATETIME_VALID_FORMATS: the fixed fields, then an optional fraction with an optional `%z` offset.
+# The offset matches what strptime accepts for `%z`: Z, or +HH[:]MM, optionally followed by [:]SS[.ffffff]
+_DATETIME_FULL_RE = re.compile(
+    r'(\d{4})-(\d\d)-(\d\d)([T ])(\d\d):(\d\d):(\d\d)'
+    r'(?:(\.\d{1,6})(Z|[+-]\d\d:?[0-5]\d(?::?[0-5]\d(?:\.\d{1,6})?)?)?)?',
+    re.ASCII,
+)
+_MAX_TZ_OFFSET_MICROSECONDS = 24 * 60 * 60 * 1000000
+# Longest string any of DATETIME_VALID_FORMATS accepts: `%Y-%m-%d %H:%M:%S` + `.ffffff` + `+HH:MM:SS.ffffff`
+_MAX_DATETIME_LENGTH = 19 + 7 + 16
+
+def _is_valid_tz_offset(z: str) -> bool:
+    """
+    Return True if `z`, an offset matched by `_DATETIME_FULL_RE`, is accepted by strptime. Mirrors the validation done by `_strptime`.
+    """
+    if z == 'Z':
+        return True
+    if z[3] == ':':
+        z = z[:3] + z[4:]
+        if len(z) > 5:
+            if z[5] != ':':
+                # Inconsistent use of ':'
+                return False
+            z = z[:5] + z[6:]
+    seconds = z[5:7]
+    if seconds and not seconds.isdigit():
+        return False
+    offset = (int(z[1:3]) * 3600 + int(z[3:5]) * 60 + int(seconds or 0)) * 1000000 + int(z[8:].ljust(6, '0'))
+    # datetime.timezone only accepts offsets strictly within a day
+    return offset < _MAX_TZ_OFFSET_MICROSECONDS
+
+@lru_cache(maxsize=8192)
+def _is_valid_datetime(value: str) -> bool:
+    """
+    Return True if `value` parses with one of DATETIME_VALID_FORMATS.
+
+    All of the formats share the fixed `%Y-%m-%d[T ]%H:%M:%S` prefix, so a single `_DATETIME_FULL_RE` match captures
+    every field and only the ranges are checked, instead of trying each format with strptime and catching its ValueError.
+
+    Cached, since the same datetime strings (e.g. dates at midnight, batch timestamps) tend to repeat across rows.
+    Strings that fail the length and separator prefilter in `parse_type_string` never reach the cache, so each entry is at most
+    `_MAX_DATETIME_LENGTH` characters long.
+    """
+    match = _DATETIME_FULL_RE.fullmatch(value)
+    if match is None:
+        if value.isascii() or _DATETIME_RE.match(value) is None:
+            return False
+        # \d also matches non-ASCII digits, which only some strptime directives accept. Leave those cases to strptime.
+        for fmt in DATETIME_VALID_FORMATS:
+            try:
+                datetime.strptime(value, fmt)
+                return True
+            except ValueError:
+                continue
+        return False
+    year, month, day, sep, hour, minute, second, fraction, tz = match.groups()
+    try:
+        datetime(int(year), int(month), int(day), int(hour), int(minute), int(second))
+    except ValueError:
+        return False
+    if tz is not None:
+        return _is_valid_tz_offset(tz)
+    # The only format with milliseconds and no tz offset uses the space separator
+    return fraction is None or sep == ' '
+
 def parse_type_string(value: str):
     """
     Return data type of string if it can be parsed as a different data type
 
     Uncomment the cases relevant to you
     """
-    # # check if bool
-    # if value.lower() in ['true', 'false']:
+    # # check if bool (the length check skips the lowercased copy for most strings)
+    # if len(value) in (4, 5) and value.lower() in {'true', 'false'}:
     #     return 'bool'
 
     # # check if int
@@ -86,17 +159,15 @@ def parse_type_string(value: str):
     #     pass
 
     # Check if in any of the valid datetime formats 
-    # First, perform a general datetime format check to limit datetime.strptime calls, improving performance
-    if re.match(DATETIME_REGEX, value):
+    # First, perform a general datetime format check to limit full datetime validation, improving performance.
+    # The length and separator checks are cheaper than a regex call and reject most strings.
+    if len(value) >= 19 and value[4] == '-' and value[7] == '-':
         # special case: remove the 'Z' character to handle formats with the 'Z' UTC stand-in (e.g. 2017-11-12 22:38:59.010000Z, 2017-11-12 22:38:59.011Z)
         if value.endswith('Z'):
             value = value[:-1]
-        for fmt in DATETIME_VALID_FORMATS:
-            try:
-                datetime.strptime(value, fmt)
-                return 'datetime_tz'
-            except ValueError:
-                continue
+        # Longer strings cannot be datetimes, and are kept out of the `_is_valid_datetime` cache
+        if len(value) <= _MAX_DATETIME_LENGTH and _is_valid_datetime(value):
+            return 'datetime_tz'
 
     # If not all of the above, leave as a str
     return 'str'
@@ -1,6 +1,9 @@
+import logging
 import os
 from io import StringIO
 
+_LOG_FORMATTER = logging.Formatter('%(asctime)s - [%(name)s, %(levelname)s] %(message)s')
+
 
 def create_local_file(output_dir: str = ""):
     """
@@ -33,3 +36,20 @@ def no_op(schema: str, object: dict[str, object]) -> None:
     Does nothing.
     """
     pass
+
+
+def get_logger(name: str, log_level: int | str) -> logging.Logger:
+    """
+    Returns the named logger, attaching the relationalize stream handler the first time it is requested.
+
+    Loggers are shared by name, so `log_level` applies to every instance using the logger.
+    """
+    logger = logging.getLogger(name)
+    if logger.level != log_level:
+        # setLevel clears the cache of every logger, so skip it when the level is unchanged
+        logger.setLevel(log_level)
+    if not logger.handlers:
+        handler = logging.StreamHandler()
+        handler.setFormatter(_LOG_FORMATTER)
+        logger.addHandler(handler)
+    return logger
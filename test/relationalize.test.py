@@ -1,5 +1,7 @@
 import json
+import sys
 import unittest
+from copy import deepcopy
 
 from setup_tests import setup_tests
 
@@ -32,6 +34,12 @@ CASE_8 = {"1": [[{"2": 3}, {"2": 4}], [{"2": 5}, {"2": 6}]]}
 
 CASE_9 = {"1": None, "2": {}, "3": []}
 
+def deeply_nested_case(depth: int):
+    case: dict[str, object] = {"1": "foobar"}
+    for _ in range(depth):
+        case = {"1": case}
+    return case
+
 class RelationalizeTest(unittest.TestCase):
     def test_no_array(self):
         with Relationalize("test_case_1", create_local_buffer()) as r:
@@ -405,5 +413,36 @@ class RelationalizeTest(unittest.TestCase):
                 r"{\"1\": null, \"3\": null}",
             )
 
+    def test_input_unchanged(self):
+        cases = [CASE_4, CASE_5, CASE_6, CASE_7, CASE_8, CASE_9]
+        expected = deepcopy(cases)
+        with Relationalize("test_case_input", create_local_buffer()) as r:
+            r.relationalize(cases)
+        self.assertListEqual(expected, cases)
+
+    def test_flush_threshold(self):
+        written: list[str] = []
+
+        def on_object_write(key: str, _: dict[str, object]):
+            written.append(r.outputs[key].getvalue())
+
+        with Relationalize("test_case_flush", create_local_buffer(), on_object_write, flush_threshold=1) as r:
+            r.relationalize([CASE_1, CASE_2])
+            self.assertListEqual(
+                [f"{json.dumps(CASE_1)}\n", f"{json.dumps(CASE_1)}\n{json.dumps(CASE_2)}\n"],
+                written,
+            )
+
+    def test_deeply_nested(self):
+        depth = sys.getrecursionlimit() * 2
+        with Relationalize("test_case_deep", create_local_buffer()) as r:
+            r.relationalize([deeply_nested_case(depth)])
+            self.assertListEqual(["test_case_deep"], list(r.outputs.keys()))
+            r.outputs["test_case_deep"].seek(0)
+            self.assertDictEqual(
+                {"_".join(["1"] * (depth + 1)): "foobar"},
+                json.loads(r.outputs["test_case_deep"].read()),
+            )
+
 if __name__ == "__main__":
     unittest.main()
@@ -1,6 +1,8 @@
+import copy
 import logging
+import pickle
 import unittest
-from copy import deepcopy
+from collections import OrderedDict
 
 from setup_tests import setup_tests
 
@@ -163,6 +165,23 @@ class SchemaTest(unittest.TestCase):
             schema.schema,            
         )
 
+    def test_choice_sorted(self):
+        schema = Schema()
+        for value in ["foobar", 1, None, 2.5, True]:
+            schema.read_object({"1": value})
+        self.assertDictEqual({"1": {"type": "c-bool-float-int-str", "is_primary": False}}, schema.schema)
+
+    def test_choice_substring_types(self):
+        schema = Schema()
+        schema.read_object({"1": [1], "2": 50000000000})
+        schema.read_object({"1": 1, "2": "foobar"})
+        schema.read_object({"1": "foobar", "2": 1})
+        self.assertDictEqual(
+            {"1": {"type": "c-int-str-str_arr", "is_primary": False}, "2": {"type": "c-bigint-int-str", "is_primary": False}},
+            schema.schema
+        )
+        self.assertDictEqual({"1_str": "foobar", "2_int": 1}, schema.convert_object({"1": "foobar", "2": 1}))
+
     def test_primary_key(self):
         schema = Schema()
         schema.read_object(CASE_6)
@@ -179,6 +198,23 @@ class SchemaTest(unittest.TestCase):
             schema.schema
         )
 
+    def test_datetime_invalid(self):
+        schema = Schema()
+        schema.read_object({
+            "1": "2021-02-29 12:00:00",
+            "2": "2020-01-01 24:00:00",
+            "3": "2020-01-01T12:00:00.123",
+            "4": "2020-01-01 12:00:00.1234567",
+            "5": "2020-01-01 12:00:00.123+24:00",
+            "6": "2020-01-01 12:00:00.123+05:0030",
+            "7": "2020-01-01 12:00:00+0500",
+            "8": "2020-01-01T12:00:00.123-05:30:15.5",
+        })
+        self.assertDictEqual(
+            {"1": {"type": "str", "is_primary": False}, "2": {"type": "str", "is_primary": False}, "3": {"type": "str", "is_primary": False}, "4": {"type": "str", "is_primary": False}, "5": {"type": "str", "is_primary": False}, "6": {"type": "str", "is_primary": False}, "7": {"type": "str", "is_primary": False}, "8": {"type": "datetime_tz", "is_primary": False}}, 
+            schema.schema
+        )
+
     def test_arrays_objects(self):
         schema = Schema()
         schema.read_object(CASE_8)
@@ -187,6 +223,66 @@ class SchemaTest(unittest.TestCase):
             schema.schema
         )
 
+    def test_subclassed_types(self):
+        class StrSubclass(str):
+            pass
+
+        schema = Schema()
+        schema.read_object({"1": OrderedDict(a=1), "2": StrSubclass("foobar"), "3": True})
+        self.assertDictEqual(
+            {"1": {"type": "str_obj", "is_primary": False}, "2": {"type": "str", "is_primary": False}, "3": {"type": "bool", "is_primary": False}},
+            schema.schema
+        )
+
+    def test_schema_assignment(self):
+        schema = Schema()
+        schema.read_object(CASE_6)
+        schema.schema = {"_id": {"type": "int", "is_primary": True}, "1": {"type": "c-int-str", "is_primary": False}}
+        schema.read_object(CASE_4)
+        self.assertDictEqual(
+            {"_id": {"type": "int", "is_primary": True}, "1": {"type": "c-int-str", "is_primary": False}},
+            schema.schema
+        )
+        self.assertDictEqual({"1_int": 1}, schema.convert_object(CASE_4))
+        self.assertDictEqual(schema.schema, Schema.deserialize(schema.serialize()).schema)
+
+    def test_schema_assignment(self):
+        schema = Schema()
+        schema.read_object(CASE_1)
+        self.assertDictEqual({"1": 1, "2": "foobar"}, schema.convert_object({"1": 1, "2": "foobar"}))
+        edited_schema = schema.schema
+        edited_schema["1"]["type"] = "c-int-str"
+        del edited_schema["2"]
+        edited_schema.update({"6": {"type": "int", "is_primary": True}})
+        # schema returns a copy, so edits only apply once assigned back
+        self.assertIn("2", schema.schema)
+        schema.schema = edited_schema
+        self.assertDictEqual({"1_int": 1, "6": 1}, schema.convert_object({"1": 1, "2": "foobar", "6": 1}))
+        self.assertListEqual(["1_int", "1_str", "3", "4", "5", "6"], schema.generate_output_columns())
+        self.assertIn('"6" INT PRIMARY KEY', schema.generate_ddl("test"))
+
+    def test_schema_copy(self):
+        schema = Schema()
+        schema.read_object(CASE_1)
+        schema.convert_object(CASE_1)
+        for copied_schema in [copy.copy(schema), copy.deepcopy(schema), pickle.loads(pickle.dumps(schema))]:
+            with self.subTest(copied_schema=copied_schema):
+                self.assertDictEqual(schema.schema, copied_schema.schema)
+                edited_schema = copied_schema.schema
+                edited_schema["1"]["type"] = "c-int-str"
+                copied_schema.schema = edited_schema
+                self.assertDictEqual({"1_int": 1}, copied_schema.convert_object(CASE_4))
+                self.assertListEqual(["1_int", "1_str", "2", "3", "4", "5"], copied_schema.generate_output_columns())
+                self.assertDictEqual({"1": 1}, schema.convert_object(CASE_4))
+
+    def test_schema_without_is_primary(self):
+        schema = Schema(schema={"1": {"type": "int"}})
+        schema.read_object(CASE_5)
+        self.assertDictEqual({"1": {"type": "c-int-str", "is_primary": False}}, schema.schema)
+        self.assertDictEqual({"1_str": "foobar"}, schema.convert_object(CASE_5))
+        merged_schema = Schema.merge({"1": {"type": "int"}}, {"1": {"type": "str"}})
+        self.assertDictEqual({"1": {"type": "c-int-str", "is_primary": False}}, merged_schema.schema)
+
     def test_generalize_choice_int_float(self):
         schema = Schema()
         schema.read_object(CASE_9A)
@@ -196,6 +292,15 @@ class SchemaTest(unittest.TestCase):
             schema.schema
         )
 
+    def test_read_objects(self):
+        schema1 = Schema()
+        for record in [CASE_1, CASE_2, CASE_6, CASE_7]:
+            schema1.read_object(record)
+
+        schema2 = Schema()
+        schema2.read_objects([CASE_1, CASE_2, CASE_6, CASE_7])
+        self.assertDictEqual(schema1.schema, schema2.schema)
+
     def test_merge_noop(self):
         schema1 = Schema()
         schema1.read_object(CASE_1)
@@ -225,6 +330,17 @@ class SchemaTest(unittest.TestCase):
             merged_schema.schema,
         )
 
+    def test_merge_input_unchanged(self):
+        schema1 = Schema()
+        schema1.read_object(CASE_1)
+        serialized1 = schema1.schema
+
+        schema2 = Schema()
+        schema2.read_object(CASE_2)
+
+        Schema.merge(serialized1, schema2.schema)
+        self.assertDictEqual(schema1.schema, serialized1)
+
     def test_merge_equal_parse(self):
         schema1 = Schema()
         schema1.read_object(CASE_1)
@@ -244,7 +360,7 @@ class SchemaTest(unittest.TestCase):
         schema1 = Schema()
         schema1.read_object(CASE_1)
 
-        converted1 = schema1.convert_object(deepcopy(CASE_1))
+        converted1 = schema1.convert_object(dict(CASE_1))
         self.assertDictEqual(converted1, CASE_1)
 
     def test_convert_object_choice(self):
@@ -252,15 +368,31 @@ class SchemaTest(unittest.TestCase):
         schema1.read_object(CASE_1)
         schema1.read_object(CASE_2)
 
-        converted1 = schema1.convert_object(deepcopy(CASE_1))
+        converted1 = schema1.convert_object(dict(CASE_1))
         self.assertDictEqual(
             {"1_int": 1, "2_str": "foobar", "3": False, "4": 1.2, "5": 50000000000}, converted1
         )
-        converted2 = schema1.convert_object(deepcopy(CASE_2))
+        converted2 = schema1.convert_object(dict(CASE_2))
         self.assertDictEqual(
             {"1_str": "foobar", "2_float": 9.9, "3": True, "4": 9.5, "5": 60000000000}, converted2
         )
 
+    def test_convert_object_schema_updated(self):
+        schema1 = Schema()
+        schema1.read_object(CASE_1)
+        compiled = schema1.compile()
+        self.assertDictEqual(CASE_1, schema1.convert_object(CASE_1))
+
+        schema1.read_object(CASE_2)
+        self.assertDictEqual(CASE_1, compiled(CASE_1))
+        self.assertDictEqual(
+            {"1_int": 1, "2_str": "foobar", "3": False, "4": 1.2, "5": 50000000000}, schema1.convert_object(CASE_1)
+        )
+
+        schema1.read_object({"a@b": 1})
+        schema1.drop_special_char_columns()
+        self.assertDictEqual({"1_int": 1}, schema1.convert_object({"1": 1, "a@b": 1}))
+
     def test_generate_ddl_no_choice(self):
         for dialect in self.sql_dialects:
             with self.subTest(dialect=dialect):
@@ -338,6 +470,22 @@ class SchemaTest(unittest.TestCase):
                 schema1.read_object(CASE_8)
                 self.assertEqual(expected_ddl, schema1.generate_ddl("test", sql_dialect=dialect()))
 
+    def test_generate_ddl_column_order(self):
+        for dialect in self.sql_dialects:
+            with self.subTest(dialect=dialect):
+                schema1 = Schema()
+                schema1.read_object({"a_b": 1, "a": 1, "b c": 1, "b_c": 1, "b": 1})
+                schema1.read_object({"a": "foobar"})
+                ddl = schema1.generate_ddl("test", sql_dialect=dialect())
+                quote = "`" if dialect is FlinkDialect else '"'
+                ddl_columns = [line.split(quote)[1] for line in ddl.splitlines()[1:-1]]
+                self.assertListEqual(["a_b", "a_int", "a_str", "b", "b c", "b_c"], ddl_columns)
+                self.assertListEqual(schema1.generate_output_columns(), ddl_columns)
+
+    def test_generate_ddl_column_escaping(self):
+        self.assertEqual('"a""b`c" TEXT', PostgresDialect.generate_ddl_column('a"b`c', "TEXT"))
+        self.assertEqual('`a"b``c` STRING', FlinkDialect.generate_ddl_column('a"b`c', "STRING"))
+
     def test_none_cases(self):
         schema1 = Schema()
         schema1.read_object(CASE_3)